@@ -237,30 +237,19 @@ class Installer:
             self._io.write_line("No dependencies to install or update")
 
         if actual_ops and (self._execute_operations or self._dry_run):
-            installs = []
-            updates = []
-            uninstalls = []
-            skipped = []
+            installs = 0
+            updates = 0
+            uninstalls = 0
+            skipped = 0
             for op in ops:
                 if op.skipped:
-                    skipped.append(op)
-                    continue
-
-                if op.job_type == "install":
-                    installs.append(
-                        "{}:{}".format(
-                            op.package.pretty_name, op.package.full_pretty_version
-                        )
-                    )
+                    skipped += 1
+                elif op.job_type == "install":
+                    installs += 1
                 elif op.job_type == "update":
-                    updates.append(
-                        "{}:{}".format(
-                            op.target_package.pretty_name,
-                            op.target_package.full_pretty_version,
-                        )
-                    )
+                    updates += 1
                 elif op.job_type == "uninstall":
-                    uninstalls.append(op.package.pretty_name)
+                    uninstalls += 1
 
             self._io.write_line("")
             self._io.write_line(
@@ -269,13 +258,13 @@ class Installer:
                 "<info>{}</> update{}, "
                 "<info>{}</> removal{}"
                 "{}".format(
-                    len(installs),
-                    "" if len(installs) == 1 else "s",
-                    len(updates),
-                    "" if len(updates) == 1 else "s",
-                    len(uninstalls),
-                    "" if len(uninstalls) == 1 else "s",
-                    ", <info>{}</> skipped".format(len(skipped))
+                    installs,
+                    "" if installs == 1 else "s",
+                    updates,
+                    "" if updates == 1 else "s",
+                    uninstalls,
+                    "" if uninstalls == 1 else "s",
+                    ", <info>{}</> skipped".format(skipped)
                     if skipped and self.is_verbose()
                     else "",
                 )
@@ -430,6 +419,9 @@ class Installer:
         self, ops, repo
     ):  # type: (List[Operation], Repository) -> None
         extra_packages = self._get_extra_packages(repo)
+        current_python = parse_constraint(
+            ".".join(str(v) for v in self._env.version_info[:3])
+        )
         for op in ops:
             if isinstance(op, Update):
                 package = op.target_package
@@ -439,24 +431,12 @@ class Installer:
             if op.job_type == "uninstall":
                 continue
 
-            current_python = parse_constraint(
-                ".".join(str(v) for v in self._env.version_info[:3])
-            )
             if not package.python_constraint.allows(
                 current_python
             ) or not self._env.is_valid_for_marker(package.marker):
                 op.skip("Not needed for the current environment")
                 continue
 
-            if self._update:
-                extras = {}
-                for extra, deps in self._package.extras.items():
-                    extras[extra] = [dep.name for dep in deps]
-            else:
-                extras = {}
-                for extra, deps in self._locker.lock_data.get("extras", {}).items():
-                    extras[extra] = [dep.lower() for dep in deps]
-
             # If a package is optional and not requested
             # in any extra we skip it
             if package.optional:
@@ -194,11 +194,17 @@ class PipInstaller(BaseInstaller):
 
         args = ["install", "--no-deps", "-U"]
 
+        setup = os.path.join(req, "setup.py")
+        has_setup = os.path.exists(setup)
+
         pyproject = TomlFile(os.path.join(req, "pyproject.toml"))
 
         has_poetry = False
         has_build_system = False
-        if pyproject.exists():
+        setup_created = False
+        # The pyproject.toml file only matters if we may
+        # have to generate a setup.py file
+        if not has_setup and pyproject.exists():
             pyproject_content = pyproject.read()
             has_poetry = (
                 "tool" in pyproject_content and "poetry" in pyproject_content["tool"]
@@ -208,8 +214,6 @@ class PipInstaller(BaseInstaller):
             # TODO: Check for pip version when proper PEP-517 support lands
             # has_build_system = ("build-system" in pyproject_content)
 
-        setup = os.path.join(req, "setup.py")
-        has_setup = os.path.exists(setup)
         if not has_setup and has_poetry and (package.develop or not has_build_system):
             # We actually need to rely on creating a temporary setup.py
             # file since pip, as of this comment, does not support
@@ -222,6 +226,8 @@ class PipInstaller(BaseInstaller):
             with open(setup, "w", encoding="utf-8") as f:
                 f.write(decode(builder.build_setup()))
 
+            setup_created = True
+
         if package.develop:
             args.append("-e")
 
@@ -230,7 +236,7 @@ class PipInstaller(BaseInstaller):
         try:
             return self.run(*args)
         finally:
-            if not has_setup and os.path.exists(setup):
+            if setup_created:
                 os.remove(setup)
 
     def install_git(self, package):
@@ -1,5 +1,8 @@
 import hashlib
-import io
+
+from typing import Dict
+from typing import Tuple
+from typing import Union
 
 from pkginfo.distribution import HEADER_ATTRS
 from pkginfo.distribution import HEADER_ATTRS_2_0
@@ -14,6 +17,9 @@ HEADER_ATTRS.update(
     {"2.1": HEADER_ATTRS_2_0 + (("Provides-Extra", "provides_extra", True),)}
 )
 
+# Hashes of already inspected files, keyed by path, size and modification time
+_hashes = {}  # type: Dict[Tuple[str, int, Union[int, float]], str]
+
 
 class FileDependency(Dependency):
     def __init__(
@@ -53,9 +59,19 @@ class FileDependency(Dependency):
         return True
 
     def hash(self):
-        h = hashlib.sha256()
-        with self._full_path.open("rb") as fp:
-            for content in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b""):
-                h.update(content)
-
-        return h.hexdigest()
+        stat = self._full_path.stat()
+        # st_mtime_ns does not exist on Python 2.7
+        mtime = getattr(stat, "st_mtime_ns", stat.st_mtime)
+        key = (str(self.full_path), stat.st_size, mtime)
+        if key not in _hashes:
+            with self._full_path.open("rb") as fp:
+                if hasattr(hashlib, "file_digest"):
+                    h = hashlib.file_digest(fp, hashlib.sha256)
+                else:
+                    h = hashlib.sha256()
+                    for content in iter(lambda: fp.read(1024 * 1024), b""):
+                        h.update(content)
+
+            _hashes[key] = h.hexdigest()
+
+        return _hashes[key]
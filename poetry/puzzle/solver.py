@@ -123,13 +123,19 @@ class Solver:
 
                 operations.append(op)
 
+        # Mapping packages to their depth once avoids
+        # a linear lookup in the sort key for each operation
+        package_depths = {}
+        for package, depth in zip(packages, depths):
+            package_depths.setdefault(package, depth)
+
         return sorted(
             operations,
             key=lambda o: (
                 o.job_type == "uninstall",
                 # Packages to be uninstalled have no depth so we default to 0
                 # since it actually doesn't matter since removals are always on top.
-                -depths[packages.index(o.package)] if o.job_type != "uninstall" else 0,
+                -package_depths[o.package] if o.job_type != "uninstall" else 0,
                 o.package.name,
                 o.package.version,
             ),
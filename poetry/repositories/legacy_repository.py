@@ -413,7 +413,7 @@ class LegacyRepository(PyPiRepository):
     def _download(self, url, dest):  # type: (str, str) -> None
         r = self._session.get(url, stream=True)
         with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
+            for chunk in r.iter_content(chunk_size=128 * 1024):
                 if chunk:
                     f.write(chunk)
 
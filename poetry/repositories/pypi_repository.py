@@ -11,7 +11,6 @@ from cachecontrol.caches.file_cache import FileCache
 from cachecontrol.controller import logger as cache_control_logger
 from cachy import CacheManager
 from html5lib.html5parser import parse
-from requests import get
 from requests import session
 from requests.exceptions import TooManyRedirects
 
@@ -71,6 +70,9 @@ class PyPiRepository(RemoteRepository):
 
         self._cache_control_cache = FileCache(str(release_cache_dir / "_http"))
         self._session = CacheControl(session(), cache=self._cache_control_cache)
+        # Distributions are only downloaded to be inspected so they must not
+        # end up in the HTTP cache, which would also buffer them in memory.
+        self._download_session = session()
         self._inspector = Inspector()
 
         self._name = "PyPI"
@@ -494,11 +496,11 @@ class PyPiRepository(RemoteRepository):
             return self._inspector.inspect_sdist(filepath)
 
     def _download(self, url, dest):  # type: (str, str) -> None
-        r = get(url, stream=True)
+        r = self._download_session.get(url, stream=True)
         r.raise_for_status()
 
         with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
+            for chunk in r.iter_content(chunk_size=128 * 1024):
                 if chunk:
                     f.write(chunk)
 
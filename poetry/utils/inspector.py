@@ -31,7 +31,7 @@ class Inspector:
         r.raise_for_status()
 
         with open(str(dest), "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
+            for chunk in r.iter_content(chunk_size=128 * 1024):
                 if chunk:
                     f.write(chunk)
 
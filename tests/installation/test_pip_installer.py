@@ -9,6 +9,7 @@ from poetry.repositories.legacy_repository import LegacyRepository
 from poetry.repositories.pool import Pool
 from poetry.utils._compat import Path
 from poetry.utils.env import NullEnv
+from poetry.utils.toml_file import TomlFile
 
 
 @pytest.fixture
@@ -156,6 +157,51 @@ def test_requirement_git_develop_true(installer, package_git):
     assert expected == result
 
 
+def test_install_directory_with_setup_does_not_read_pyproject(
+    mocker, tmp_dir, installer
+):
+    directory = Path(tmp_dir) / "demo"
+    directory.mkdir()
+    setup = directory / "setup.py"
+    with setup.open("w", encoding="utf-8") as f:
+        f.write(u"from setuptools import setup\n\nsetup()\n")
+
+    with (directory / "pyproject.toml").open("w", encoding="utf-8") as f:
+        f.write(u'[tool.poetry]\nname = "demo"\nversion = "1.0.0"\n')
+
+    read = mocker.spy(TomlFile, "read")
+
+    package = Package("demo", "1.0.0")
+    package.source_type = "directory"
+    package.source_url = str(directory)
+
+    installer.install(package)
+
+    assert not read.called
+    assert setup.exists()
+
+
+def test_install_directory_removes_generated_setup(tmp_dir, pool):
+    null_env = NullEnv()
+    installer = PipInstaller(null_env, NullIO(), pool)
+
+    directory = Path(tmp_dir) / "simple_project"
+    shutil.copytree(
+        str(Path(__file__).parent.parent / "fixtures" / "simple_project"),
+        str(directory),
+    )
+
+    package = Package("simple-project", "1.2.3")
+    package.source_type = "directory"
+    package.source_url = str(directory)
+
+    installer.install(package)
+
+    assert len(null_env.executed) == 1
+    assert null_env.executed[0][-1] == str(directory)
+    assert not (directory / "setup.py").exists()
+
+
 def test_uninstall_git_package_nspkg_pth_cleanup(mocker, tmp_venv, pool):
     # this test scenario requires a real installation using the pip installer
     installer = PipInstaller(tmp_venv, NullIO(), pool)
@@ -1,6 +1,11 @@
+import hashlib
+import os
+import shutil
+
 import pytest
 
 from poetry.packages import FileDependency
+from poetry.utils._compat import PY2
 from poetry.utils._compat import Path
 
 
@@ -15,3 +20,69 @@ def test_file_dependency_wrong_path():
 def test_file_dependency_dir():
     with pytest.raises(ValueError):
         FileDependency("demo", DIST_PATH)
+
+
+def test_file_dependency_hash_is_computed_once(mocker):
+    dependency = FileDependency("demo", DIST_PATH / "demo-0.1.0.tar.gz")
+    digest = dependency.hash()
+
+    spy = mocker.spy(hashlib, "sha256")
+
+    assert digest == FileDependency("demo", DIST_PATH / "demo-0.1.0.tar.gz").hash()
+    assert not spy.called
+
+
+def test_file_dependency_hash_is_recomputed_when_file_changes(tmp_dir):
+    archive = Path(tmp_dir) / "demo-0.1.0.tar.gz"
+    shutil.copyfile(str(DIST_PATH / "demo-0.1.0.tar.gz"), str(archive))
+    dependency = FileDependency("demo", archive)
+    digest = dependency.hash()
+
+    with archive.open("ab") as f:
+        f.write(b"\0")
+
+    assert digest != dependency.hash()
+
+
+@pytest.mark.skipif(PY2, reason="Nanosecond timestamps require Python 3")
+def test_file_dependency_hash_is_recomputed_when_file_is_rewritten(tmp_dir):
+    archive = Path(tmp_dir) / "demo-0.1.0.tar.gz"
+    with archive.open("wb") as f:
+        f.write(b"a" * 64)
+
+    # Both modification times map to the same float timestamp
+    mtime_ns = 1600000000 * 10 ** 9
+    os.utime(str(archive), ns=(mtime_ns, mtime_ns))
+    dependency = FileDependency("demo", archive)
+    digest = dependency.hash()
+
+    with archive.open("wb") as f:
+        f.write(b"b" * 64)
+
+    os.utime(str(archive), ns=(mtime_ns + 1, mtime_ns + 1))
+
+    assert hashlib.sha256(b"b" * 64).hexdigest() == dependency.hash()
+    assert digest != dependency.hash()
+
+
+@pytest.mark.parametrize("with_file_digest", [True, False])
+def test_file_dependency_hash(mocker, monkeypatch, with_file_digest):
+    if with_file_digest and not hasattr(hashlib, "file_digest"):
+        pytest.skip("hashlib.file_digest() requires Python 3.11")
+
+    # Make sure the digest is actually computed
+    mocker.patch.dict("poetry.packages.file_dependency._hashes", clear=True)
+    if with_file_digest:
+        file_digest = mocker.spy(hashlib, "file_digest")
+    else:
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+    dependency = FileDependency("demo", DIST_PATH / "demo-0.1.0.tar.gz")
+
+    assert (
+        "72e8531e49038c5f9c4a837b088bfcb8011f4a9f76335c8f0654df6ac539b3d6"
+        == dependency.hash()
+    )
+
+    if with_file_digest:
+        assert file_digest.called
@@ -5,6 +5,8 @@ from io import BytesIO
 
 import pytest
 
+from cachecontrol.adapter import CacheControlAdapter
+from requests.adapters import HTTPAdapter
 from requests.exceptions import TooManyRedirects
 from requests.models import Response
 
@@ -215,3 +217,31 @@ def test_urls():
 
     assert "https://pypi.org/simple/" == repository.url
     assert "https://pypi.org/simple/" == repository.authenticated_url
+
+
+def test_download_reuses_a_session_without_caching(mocker, tmp_dir):
+    def send(adapter, request, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response.headers["Cache-Control"] = "max-age=365000000, immutable"
+        response.raw = BytesIO(b"archive contents")
+        response.url = request.url
+        response.request = request
+
+        return response
+
+    send = mocker.patch.object(HTTPAdapter, "send", autospec=True, side_effect=send)
+    repository = PyPiRepository()
+    cache_set = mocker.spy(repository._cache_control_cache, "set")
+
+    for filename in ["foo-1.0.0-py2.py3-none-any.whl", "foo-1.0.0.tar.gz"]:
+        dest = Path(tmp_dir) / filename
+        repository._download("https://files.pythonhosted.org/" + filename, str(dest))
+
+        assert b"archive contents" == dest.read_bytes()
+
+    adapters = [call[0][0] for call in send.call_args_list]
+    assert 2 == len(adapters)
+    assert adapters[0] is adapters[1]
+    assert not isinstance(adapters[0], CacheControlAdapter)
+    assert not cache_set.called